@@ -1,31 +1,146 @@
-import configparser
+import copy
+import os
+import pickle
+from dataclasses import dataclass
 from pathlib import Path
 
+# These default values will be used if no config file exists
+DEFAULTS = {
+    "server": {"host": "localhost", "port": "43007"},
+    "hotkey": {
+        "mic_only": "<Ctrl><Alt>R",
+        "mic_and_output": "<Ctrl><Alt>E",
+    },
+    "recording": {"max_duration": "60"},
+}
+
+# Refuse to parse a config file this large; ours is a few hundred bytes
+_MAX_CONFIG_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Immutable snapshot of the config with pre-parsed, typed values.
+
+    Hot paths (the server status check, process startup) read these fields
+    directly instead of re-indexing the config mapping and re-parsing ints
+    on every call.
+    """
+
+    host: str
+    port: int
+    mic_only: str
+    mic_and_output: str
+    max_duration: int
+
+    @classmethod
+    def from_mapping(cls, config: dict) -> "AppConfig":
+        """Build a typed snapshot from a loaded config mapping."""
+        return cls(
+            host=config["server"]["host"],
+            port=int(config["server"]["port"]),
+            mic_only=config["hotkey"]["mic_only"],
+            mic_and_output=config["hotkey"]["mic_and_output"],
+            max_duration=int(config["recording"]["max_duration"]),
+        )
+
 
 class Config:
     """Handles configuration loading and management."""
 
+    config_path = Path.home() / ".config" / "whisper-client" / "config.ini"
+    snapshot_path = Path.home() / ".cache" / "whisper-client" / "config.snapshot.pkl"
+
+    @classmethod
+    def load_app_config(cls) -> AppConfig:
+        """Load the typed config, skipping the INI parse when possible.
+
+        A pickled (mtime_ns, AppConfig) snapshot sits next to the user's
+        cache; if the config file's mtime is unchanged since the snapshot
+        was written, we return the snapshot after a single stat() instead
+        of re-parsing the INI file.
+        """
+        try:
+            mtime_ns = os.stat(cls.config_path).st_mtime_ns
+            with open(cls.snapshot_path, "rb") as f:
+                cached_mtime_ns, cfg = pickle.load(f)
+            if cached_mtime_ns == mtime_ns and isinstance(cfg, AppConfig):
+                return cfg
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+            # Missing/stale/corrupt snapshot - fall through to a full parse
+            pass
+
+        cfg = AppConfig.from_mapping(cls.load())
+        cls.write_snapshot(cfg)
+        return cfg
+
+    @classmethod
+    def write_snapshot(cls, cfg: AppConfig) -> None:
+        """Write the pickled snapshot keyed by the config file's mtime."""
+        try:
+            mtime_ns = os.stat(cls.config_path).st_mtime_ns
+            cls.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cls.snapshot_path, "wb") as f:
+                pickle.dump((mtime_ns, cfg), f)
+        except FileNotFoundError:
+            # No config file yet - defaults are cheap to rebuild, so there
+            # is nothing worth snapshotting
+            pass
+        except OSError as e:
+            # The snapshot is purely an optimization; never fail the load
+            print(f"Error writing config snapshot: {e}")
+
     @staticmethod
-    def load() -> configparser.ConfigParser:
-        config = configparser.ConfigParser()
+    def load() -> dict:
+        """Load the config as {section: {key: value}}, merged over defaults.
 
-        # These default values will be used if no config file exists
-        config["server"] = {"host": "localhost", "port": "43007"}
-        config["hotkey"] = {
-            "mic_only": "<Ctrl><Alt>R",
-            "mic_and_output": "<Ctrl><Alt>E",
-        }
-        config["recording"] = {"max_duration": "60"}
+        Our config is four key=value pairs, so a ~20-line INI reader covers
+        it without importing configparser's proxies and interpolation
+        machinery on startup.
+        """
+        config = copy.deepcopy(DEFAULTS)
 
         # Store config in standard ~/.config directory
-        config_path = Path.home() / ".config" / "whisper-client" / "config.ini"
+        config_path = Config.config_path
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         if config_path.exists():
-            config.read(config_path)
-        else:
-            # Create default config file if it doesn't exist
-            with open(config_path, "w") as f:
-                config.write(f)
+            try:
+                if os.path.getsize(config_path) <= _MAX_CONFIG_BYTES:
+                    for section, values in Config._parse_ini(config_path).items():
+                        config.setdefault(section, {}).update(values)
+            except OSError as e:
+                print(f"Error reading config: {e}")
+        # No file means defaults, which live purely in memory; the file is
+        # only written when the user explicitly saves settings
 
         return config
+
+    @staticmethod
+    def _parse_ini(path: Path) -> dict:
+        """Minimal INI reader: [section] headers and key = value lines."""
+        sections: dict = {}
+        current = None
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith(("#", ";")):
+                    continue
+                if line.startswith("[") and line.endswith("]"):
+                    current = sections.setdefault(line[1:-1], {})
+                elif "=" in line and current is not None:
+                    key, _, value = line.partition("=")
+                    current[key.strip()] = value.strip()
+        return sections
+
+    @staticmethod
+    def save(config: dict) -> None:
+        """Write the config mapping back out in INI format."""
+        lines = []
+        for section, values in config.items():
+            lines.append(f"[{section}]")
+            for key, value in values.items():
+                lines.append(f"{key} = {value}")
+            lines.append("")
+        with open(Config.config_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
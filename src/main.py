@@ -1,5 +1,9 @@
+import collections
+import concurrent.futures
+from enum import IntEnum
 from pathlib import Path
 import queue
+import re
 import signal
 import socket
 import subprocess
@@ -10,18 +14,38 @@ import os
 import json
 
 import gi
-from config import Config
-from ui.settings import SettingsDialog
-from ui.transcript import TranscriptViewerDialog
+from config import AppConfig, Config
 from utils import setup_display
 
+# The settings and transcript dialog modules are imported lazily inside
+# their menu handlers; neither is needed to get the indicator on screen
+
 # These version requirements must be set before importing the gi modules
 # They ensure we're using compatible versions of GTK and related libraries
 # for creating the GUI, handling global hotkeys, and system tray functionality
 gi.require_version("Gtk", "3.0")
 gi.require_version("Keybinder", "3.0")
 gi.require_version("AppIndicator3", "0.1")
-from gi.repository import Gtk, GLib, Keybinder, AppIndicator3, Gdk  # noqa: E402 # type: ignore[import]
+from gi.repository import Gtk, GLib, Gio, Keybinder, AppIndicator3, Gdk  # noqa: E402 # type: ignore[import]
+
+# Server output lines look like b"start_ms end_ms  transcribed text".
+# Matching the raw bytes with one C-level regex avoids decoding and
+# splitting every line; only the text group is decoded.
+_SEG_RE = re.compile(rb"(\d+) (\d+)  (.+)")
+
+
+class StatusKind(IntEnum):
+    """Status states shown in the indicator menu.
+
+    Values index the per-status label and icon tables, so updates dispatch
+    on an int instead of substring-matching the label text.
+    """
+
+    READY = 0
+    TRANSCRIBING = 1
+    RECORDING_MIC_AND_OUTPUT = 2
+    RECORDING_ERROR = 3
+    SERVER_ERROR = 4
 
 
 class WhisperIndicatorApp:
@@ -36,9 +60,13 @@ class WhisperIndicatorApp:
 
     def __init__(self):
         Gtk.init(None)
-        self.config = Config.load()
-        self.mic_hotkey = self.config["hotkey"]["mic_only"]
-        self.mic_and_output_hotkey = self.config["hotkey"]["mic_and_output"]
+        # The full config mapping is only needed by the settings dialog, so
+        # it is loaded lazily in show_settings; startup just needs the
+        # snapshot.
+        self.config = None
+        self.cfg = Config.load_app_config()
+        self.mic_hotkey = self.cfg.mic_only
+        self.mic_and_output_hotkey = self.cfg.mic_and_output
         self.settings_dialog = None
 
         self.init_state()
@@ -70,17 +98,54 @@ class WhisperIndicatorApp:
         - File paths and settings
         """
         self.is_recording = False
-        self.audio_process_for_mic_transcription: Optional[subprocess.Popen] = None
-        self.netcat_process: Optional[subprocess.Popen] = None
-        self.text_queue: queue.Queue = queue.Queue()
-        self.seen_segments: Set[str] = set()
-        self.recording_start_time: Optional[float] = None
+        # arecord child whose stdout pipe is spliced into the server socket
+        self.arecord_process: Optional[subprocess.Popen] = None
+        # In-process TCP connection to the whisper server: audio goes out
+        # through it and transcription replies come back on it
+        self.server_stream_sock: Optional[socket.socket] = None
+        # Long-lived "xdotool -" process; typing a batch is a pipe write
+        # instead of a fork+exec per batch
+        self.xdotool_proc: Optional[subprocess.Popen] = None
+        # Scratch buffer for server replies (bytearray so appends and
+        # consumed-prefix trims are in-place), plus the GLib watch id so
+        # the fd source can be removed on stop
+        self.server_reply_buffer = bytearray()
+        self.server_reply_watch_id: Optional[int] = None
+        # Segment dedup: a set for O(1) membership mirrored by a bounded
+        # ring that evicts the oldest key, capping memory over long sessions
+        self.seen_segments_set: Set[int] = set()
+        self.seen_segments_ring: collections.deque = collections.deque(maxlen=512)
+        # Monotonic start timestamp: immune to wall-clock jumps and cheaper
+        # to read than time.time()
+        self.recording_start_mono: Optional[float] = None
         self.recording_duration = 0
         self.server_last_seen_at = time.time()
+        # Persistent keepalive connection to the whisper server; None means
+        # the next status tick should kick off an async reconnect. The fd
+        # watch id is kept so dropping the connection from outside the
+        # watch's own callback can deregister it too
+        self.server_connection = None
+        self.server_keepalive_watch_id: Optional[int] = None
+        self.server_probe_pending = False
+        # Exponential backoff between failed reconnect attempts, so a long
+        # outage costs one connect per minute instead of one per tick
+        self.server_probe_backoff = 5.0
+        self.next_server_probe_at = 0.0
+        # 0 while the periodic probe is paused (e.g. during transcription,
+        # when the streaming pipeline already holds a server connection)
+        self.server_check_timer = 0
         # Used to periodically update the recording duration in the toolbar:
         self.timer_id_for_gui_updates: Optional[int] = None
         self.transcript_path = Path.home() / "whisper-transcript.json"
-        self.max_recording_duration = int(self.config["recording"]["max_duration"])
+        # Sessions are appended as JSON lines from a background thread so
+        # stopping a recording never blocks the GTK main thread on file I/O
+        self.transcript_jsonl_path = self.transcript_path.with_suffix(".jsonl")
+        self.transcript_writer_q: queue.Queue = queue.Queue()
+        self.transcript_writer_thread = threading.Thread(
+            target=self.transcript_writer_loop, daemon=True
+        )
+        self.transcript_writer_thread.start()
+        self.max_recording_duration = self.cfg.max_duration
         self.current_session_text = []
         self.session_start_time = None
         self.recording_path = Path.home() / "whisper-recordings"
@@ -88,6 +153,14 @@ class WhisperIndicatorApp:
         self.audio_process_for_recording_mic_and_output: Optional[subprocess.Popen] = (
             None
         )
+        # Default sink monitor name, cached so starting a recording doesn't
+        # fork a pactl subprocess every time
+        self.cached_default_sink_monitor: Optional[str] = None
+        # Reused worker threads for the (debug-only) ffmpeg output monitors,
+        # instead of creating fresh Thread objects every recording start
+        self.monitor_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ffmpeg-mon"
+        )
 
     def init_ui(self) -> None:
         """Initialize UI components."""
@@ -97,13 +170,27 @@ class WhisperIndicatorApp:
 
     def setup_status_labels(self) -> None:
         """Set up status message templates."""
+        self.status_base_text = ""
+        self.last_time_text: Optional[str] = None
+        # Last label/icon actually pushed to GTK, so steady-state ticks can
+        # skip the property set (GTK invalidates and redraws even on no-ops)
+        self.current_label_text = ""
+        self.current_icon_name = ""
         self.labels = {
-            "ready": "🎙️ Ready",
-            "transcribing": f"🔴 Transcribing Mic (Press {self.mic_hotkey} to stop)",
-            "recording_mic_and_output": f"🔴 Recording Mic and Output (Press {self.mic_and_output_hotkey} to stop)",
-            "recording_error": "🚫 Recording Error",
-            "server_error": "❌ Server Unavailable",
+            StatusKind.READY: "🎙️ Ready",
+            StatusKind.TRANSCRIBING: f"🔴 Transcribing Mic (Press {self.mic_hotkey} to stop)",
+            StatusKind.RECORDING_MIC_AND_OUTPUT: f"🔴 Recording Mic and Output (Press {self.mic_and_output_hotkey} to stop)",
+            StatusKind.RECORDING_ERROR: "🚫 Recording Error",
+            StatusKind.SERVER_ERROR: "❌ Server Unavailable",
         }
+        # Icon transition per status, indexed by StatusKind value
+        self.icon_setters = (
+            self.set_ready_icon,  # READY
+            self.set_recording_icon,  # TRANSCRIBING
+            self.set_recording_icon,  # RECORDING_MIC_AND_OUTPUT
+            self.set_error_icon,  # RECORDING_ERROR
+            self.set_error_icon,  # SERVER_ERROR
+        )
 
     def setup_indicator(self) -> None:
         """Set up the system tray indicator."""
@@ -115,29 +202,44 @@ class WhisperIndicatorApp:
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
         self.indicator.set_label("", "")
 
+        # Install the recording-icon CSS once; status transitions only swap
+        # icons instead of re-parsing CSS and mutating the provider list
+        self.red_css_provider = Gtk.CssProvider()
+        self.red_css_provider.load_from_data(
+            b".app-indicator-icon { color: #ff0000; }"
+        )
+        Gtk.StyleContext.add_provider_for_screen(
+            Gdk.Screen.get_default(),
+            self.red_css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        )
+
     def setup_menu(self) -> None:
         """Set up the indicator menu."""
         self.menu = Gtk.Menu()
 
         # Status item
-        self.status_item = Gtk.MenuItem(label=self.labels["ready"])
+        self.status_item = Gtk.MenuItem(label=self.labels[StatusKind.READY])
         self.status_item.set_sensitive(False)
         self.menu.append(self.status_item)
 
         self.menu.append(Gtk.SeparatorMenuItem())
 
-        # Toggle recording item
-        toggle_item = Gtk.MenuItem(
+        # Toggle recording items; references are kept so a settings save can
+        # patch the hotkey text in place instead of rebuilding the menu
+        self.mic_toggle_item = Gtk.MenuItem(
             label=f"Toggle Mic Transcribe+Type ({self.mic_hotkey})"
         )
-        toggle_item.connect("activate", self.toggle_mic_transcription)
-        self.menu.append(toggle_item)
+        self.mic_toggle_item.connect("activate", self.toggle_mic_transcription)
+        self.menu.append(self.mic_toggle_item)
 
-        toggle_item = Gtk.MenuItem(
+        self.mic_output_toggle_item = Gtk.MenuItem(
             label=f"Toggle Mic and Output Recording ({self.mic_and_output_hotkey})"
         )
-        toggle_item.connect("activate", self.toggle_recording_mic_and_output)
-        self.menu.append(toggle_item)
+        self.mic_output_toggle_item.connect(
+            "activate", self.toggle_recording_mic_and_output
+        )
+        self.menu.append(self.mic_output_toggle_item)
 
         # Add Settings item
         settings_item = Gtk.MenuItem(label="Settings")
@@ -177,56 +279,120 @@ class WhisperIndicatorApp:
         """Check if the whisper server is available.
 
         This runs periodically to:
-        1. Test connection to server
+        1. Keep a persistent connection to the server, reconnecting
+           asynchronously (off the GTK main thread) when it drops
         2. Update status display
         3. Track last successful connection time
         """
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(
-                (self.config["server"]["host"], int(self.config["server"]["port"]))
-            )
-            sock.close()
-
-            if result == 0:
-                self.server_last_seen_at = time.time()
-                if not self.is_recording:
-                    self.update_status_text(self.labels["ready"])
-            elif not self.is_recording:
-                self.update_status_text(self.labels["server_error"])
-
-        except Exception as e:
-            print(f"Server check error: {e}")
+        if self.server_connection is not None:
+            # Connection is healthy; the fd watch drops it on error/hangup
+            self.server_last_seen_at = time.time()
             if not self.is_recording:
-                self.update_status_text(self.labels["server_error"])
+                self.update_status_text(StatusKind.READY)
+        elif (
+            not self.server_probe_pending
+            and time.monotonic() >= self.next_server_probe_at
+        ):
+            self.server_probe_pending = True
+            client = Gio.SocketClient.new()
+            client.set_timeout(1)
+            client.connect_to_host_async(
+                self.cfg.host, self.cfg.port, None, self.on_server_probe_done
+            )
 
         self.update_server_last_connection_time_label()
         return True
 
-    def update_status_text(self, text: str) -> None:
-        """Update the status display."""
-        self.status_item.set_label(text)
-
-        if "Recording" in text:
-            self.set_recording_icon()
-        elif "Error" in text or "Unavailable" in text:
-            self.indicator.set_icon("network-error-symbolic")
+    def on_server_probe_done(self, client, result) -> None:
+        """Handle completion of the async connection attempt."""
+        self.server_probe_pending = False
+        try:
+            connection = client.connect_to_host_finish(result)
+        except GLib.Error:
+            connection = None
+
+        if connection is not None:
+            self.server_connection = connection
+            self.server_probe_backoff = 5.0
+            self.next_server_probe_at = 0.0
+            # Kernel-level keepalives surface a dead peer as HUP/ERR on the
+            # fd watch without any application-side probing
+            connection.get_socket().set_keepalive(True)
+            self.server_last_seen_at = time.time()
+            if not self.is_recording:
+                self.update_status_text(StatusKind.READY)
+            # Watch the socket fd so a server-side close is noticed
+            # immediately instead of on the next probe
+            self.server_keepalive_watch_id = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT,
+                connection.get_socket().get_fd(),
+                GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+                self.on_server_connection_event,
+            )
         else:
-            self.indicator.set_icon("audio-input-microphone-symbolic")
+            # Back off: double the wait before the next attempt, up to 60s
+            self.next_server_probe_at = time.monotonic() + self.server_probe_backoff
+            self.server_probe_backoff = min(self.server_probe_backoff * 2, 60.0)
+            if not self.is_recording:
+                self.update_status_text(StatusKind.SERVER_ERROR)
+
+    def on_server_connection_event(self, fd: int, condition) -> bool:
+        """Drop the keepalive connection on any activity or hangup."""
+        # Returning False removes this watch; clear the id first so
+        # drop_server_connection doesn't source_remove it a second time
+        self.server_keepalive_watch_id = None
+        self.drop_server_connection()
+        return False  # Remove the fd watch
+
+    def drop_server_connection(self) -> None:
+        """Close the keepalive connection so the next tick reconnects."""
+        # Deregister the fd watch before closing: a watch left on a closed
+        # (and possibly reused) fd would fire against the wrong connection
+        if self.server_keepalive_watch_id is not None:
+            GLib.source_remove(self.server_keepalive_watch_id)
+            self.server_keepalive_watch_id = None
+        if self.server_connection is not None:
+            try:
+                self.server_connection.close(None)
+            except GLib.Error:
+                pass
+            self.server_connection = None
+
+    def update_status_text(self, kind: StatusKind) -> None:
+        """Update the status display."""
+        # Remember the bare label so the periodic "last seen" suffix can be
+        # recomposed without reading it back out of GTK. Compare against the
+        # previous base text, not current_label_text (which carries the
+        # suffix between ticks): a tick that lands on the same status must
+        # leave the suffixed label and its memoized time text untouched
+        text = self.labels[kind]
+        if text != self.status_base_text:
+            self.status_base_text = text
+            self.current_label_text = text
+            self.last_time_text = None
+            self.status_item.set_label(text)
+
+        self.icon_setters[kind]()
+
+    def set_ready_icon(self) -> None:
+        """Show the idle microphone icon."""
+        self.set_icon_if_changed("audio-input-microphone-symbolic")
+
+    def set_error_icon(self) -> None:
+        """Show the error icon."""
+        self.set_icon_if_changed("network-error-symbolic")
+
+    def set_icon_if_changed(self, icon_name: str) -> None:
+        """Swap the indicator icon only when it actually differs."""
+        if icon_name != self.current_icon_name:
+            self.current_icon_name = icon_name
+            self.indicator.set_icon(icon_name)
 
     def set_recording_icon(self) -> None:
         """Set up the recording indicator icon."""
-        self.indicator.set_icon("media-record")
-        self.indicator.set_icon_full("media-record", "Recording")
-        css = b".app-indicator-icon { color: #ff0000; }"
-        style_provider = Gtk.CssProvider()
-        style_provider.load_from_data(css)
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+        if self.current_icon_name != "media-record":
+            self.current_icon_name = "media-record"
+            self.indicator.set_icon_full("media-record", "Recording")
 
     def update_server_last_connection_time_label(self) -> None:
         """Update the status text with time since last connection."""
@@ -238,30 +404,43 @@ class WhisperIndicatorApp:
         else:
             time_text = f"{int(elapsed / 3600)}h ago"
 
-        current_text = self.status_item.get_label()
-        base_text = current_text.split(" (Server Last seen:")[0]
-        self.status_item.set_label(f"{base_text} (Server Last seen: {time_text})")
+        # Skip the GTK set_label (and the redraw it forces) when the
+        # displayed bucket hasn't changed since last tick
+        if time_text == self.last_time_text:
+            return
+        self.last_time_text = time_text
+        self.current_label_text = (
+            f"{self.status_base_text} (Server Last seen: {time_text})"
+        )
+        self.status_item.set_label(self.current_label_text)
 
     def start_mic_recording_for_transcription(self) -> None:
         """Start a new recording session."""
         self.is_recording = True
-        self.seen_segments.clear()
+        self.seen_segments_set.clear()
+        self.seen_segments_ring.clear()
         self.current_session_text = []
         self.session_start_time = time.strftime("%Y-%m-%d_%H-%M-%S")
 
         if self.start_mic_recording_and_streaming_processes():
-            GLib.timeout_add(50, self.process_text_queue)
+            # The streaming pipeline holds its own TCP connection, so the
+            # periodic probe is redundant while transcribing; pause it
+            if self.server_check_timer:
+                GLib.source_remove(self.server_check_timer)
+                self.server_check_timer = 0
             self.recording_duration = 0
-            self.recording_start_time = time.time()
+            self.recording_start_mono = time.monotonic()
             self.indicator.set_label(f"0/{self.max_recording_duration}s", "")
-            self.timer_id_for_gui_updates = GLib.timeout_add(
-                1000, self.update_timer_for_transcription
+            # Second-granularity source: GLib coalesces these wakeups with
+            # other per-second timers instead of scheduling a 1000 ms slot
+            self.timer_id_for_gui_updates = GLib.timeout_add_seconds(
+                1, self.update_timer_for_transcription
             )
-            self.update_status_text(self.labels["transcribing"])
+            self.update_status_text(StatusKind.TRANSCRIBING)
         else:
             self.is_recording = False
             self.indicator.set_label("", "")
-            self.update_status_text(self.labels["recording_error"])
+            self.update_status_text(StatusKind.RECORDING_ERROR)
 
     def stop_mic_recording_for_transcription(self) -> None:
         """Stop the current mic-only recording session."""
@@ -277,117 +456,198 @@ class WhisperIndicatorApp:
         if self.timer_id_for_gui_updates:
             GLib.source_remove(self.timer_id_for_gui_updates)
             self.timer_id_for_gui_updates = None
+        if not self.server_check_timer:
+            self.set_up_server_status_check_timer()
         self.indicator.set_label("", "")
-        self.update_status_text(self.labels["ready"])
+        self.update_status_text(StatusKind.READY)
 
     def start_mic_recording_and_streaming_processes(self) -> bool:
-        """Start the recording and network processes.
+        """Start the recording process and the server connection.
 
         This method:
-        1. Starts arecord to capture audio
-        2. Pipes audio to netcat (nc) which sends it to the whisper server
-        3. Creates a thread to read the server's responses
+        1. Opens a TCP connection to the whisper server in-process (no nc
+           hop), so a refused connect or server-side close is reported
+           precisely instead of nc exiting silently
+        2. Starts arecord and splices its stdout pipe into the socket
+           kernel-side from a helper thread
+        3. Watches the socket on the GLib main loop for responses
         """
+        sock = None
         try:
-            self.audio_process_for_mic_transcription = subprocess.Popen(
-                [
-                    "arecord",
-                    "-f",  # Format:
-                    "S16_LE",  # 16-bit signed integers, little-endian
-                    "-c1",  # Single channel (mono) recording
-                    "-r",  # Sample rate:
-                    "16000",  # 16kHz
-                    "-t",  # Audio type:
-                    "raw",  # Raw audio format (no header) for direct streaming
-                    "-D",  # Device:
-                    "default",  # Use system default ALSA audio input device
-                ],
+            sock = socket.create_connection((self.cfg.host, self.cfg.port), timeout=5)
+            sock.settimeout(None)
+            # Audio chunks and the final flush should go out immediately
+            # rather than sit in Nagle's buffer waiting for an ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self.server_stream_sock = sock
+
+            # arecord flags: S16_LE 16-bit little-endian, mono, 16kHz, raw
+            # (headerless) output from the default ALSA input device
+            self.arecord_process = subprocess.Popen(
+                ["arecord", "-f", "S16_LE", "-c1", "-r", "16000", "-t", "raw",
+                 "-D", "default"],
                 stdout=subprocess.PIPE,
-                preexec_fn=os.setsid,
+                start_new_session=True,
             )
+            threading.Thread(
+                target=self.stream_audio_to_server,
+                args=(self.arecord_process.stdout.fileno(), sock),
+                daemon=True,
+            ).start()
 
-            self.netcat_process = subprocess.Popen(
-                ["nc", self.config["server"]["host"], self.config["server"]["port"]],
-                stdin=self.audio_process_for_mic_transcription.stdout,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=os.setsid,
+            # One xdotool per session reading commands from stdin, reused
+            # for every typed batch
+            self.xdotool_proc = subprocess.Popen(
+                ["xdotool", "-"], stdin=subprocess.PIPE, bufsize=0
             )
 
-            if self.audio_process_for_mic_transcription.stdout:
-                self.audio_process_for_mic_transcription.stdout.close()
-
-            self.read_thread = threading.Thread(target=self.read_output)
-            # Make it a daemon thread so it doesn't block the main thread from exiting
-            self.read_thread.daemon = True
-            self.read_thread.start()
+            # Dispatch server replies from the main loop itself: no reader
+            # thread, no queue, and no wakeups while the server is silent
+            self.server_reply_buffer.clear()
+            self.server_reply_watch_id = GLib.io_add_watch(
+                sock.fileno(),
+                GLib.PRIORITY_DEFAULT,
+                GLib.IO_IN | GLib.IO_HUP,
+                self.on_server_reply_readable,
+            )
             return True
 
         except Exception as e:
             print(f"Error starting recording: {e}")
+            if sock is not None:
+                sock.close()
+            self.server_stream_sock = None
             self.stop_mic_and_output_recording()
             return False
 
-    def read_output(self) -> None:
+    def stream_audio_to_server(self, pipe_fd: int, sock: socket.socket) -> None:
+        """Move mic audio from arecord's stdout pipe into the server socket.
+
+        Runs on a daemon thread. os.splice moves the pages pipe-to-socket
+        inside the kernel, so the audio never crosses into userspace; a
+        read/send loop covers platforms without splice. The loop ends when
+        arecord is killed (pipe EOF) or the server closes the connection.
+        """
+        try:
+            if hasattr(os, "splice"):
+                flags = os.SPLICE_F_MOVE | os.SPLICE_F_MORE
+                while os.splice(pipe_fd, sock.fileno(), 65536, flags=flags) > 0:
+                    pass
+            else:
+                while True:
+                    chunk = os.read(pipe_fd, 65536)
+                    if not chunk:
+                        break
+                    sock.sendall(chunk)
+        except OSError:
+            # Recording stopped or the connection dropped; the reply watch
+            # surfaces server-side failures to the user
+            pass
+
+    def on_server_reply_readable(self, fd: int, condition) -> bool:
         """Read and process output from the whisper server.
 
         The server sends lines in format:
         "start_ms end_ms  transcribed_text"
 
-        This method parses these lines and queues the text for typing.
+        Called by the GLib main loop whenever the server socket becomes
+        readable; parses complete lines and types new segments in one batch.
         """
-        while self.is_recording and self.netcat_process and self.netcat_process.stdout:
-            try:
-                line = self.netcat_process.stdout.readline().decode().strip()
-                if not line:
-                    continue
-
-                parts = line.split("  ", 1)
-                if len(parts) != 2:
-                    continue
-
-                timestamp, text = parts
-                start_ms, end_ms = map(int, timestamp.split())
-                chunk_duration = (end_ms - start_ms) / 1000
-                chunk_start_time = start_ms / 1000
-
-                if timestamp not in self.seen_segments:
-                    self.seen_segments.add(timestamp)
-                    received_time = time.time() - (self.recording_start_time or 0)
-                    self.text_queue.put(
-                        (text, received_time, chunk_duration, chunk_start_time)
-                    )
-
-            except Exception as e:
-                print(f"Error reading output: {e}")
-                break
-
-    def process_text_queue(self) -> bool:
-        """Process queued text from the whisper server.
+        if not self.is_recording:
+            self.server_reply_watch_id = None
+            return False  # Remove the fd watch
 
-        This runs periodically to:
-        1. Check for new transcribed text
-        2. Type the text using xdotool
-        3. Save to transcript file
-        """
+        hangup = bool(condition & GLib.IO_HUP)
         try:
-            while True:
-                text, received_time, chunk_duration, chunk_start_time = (
-                    self.text_queue.get_nowait()
-                )
-                self.type_text(text + " ")
-                self.text_queue.task_done()
-        except queue.Empty:
-            pass
-        return self.is_recording
+            # The socket stays blocking for the splice thread's sake, so
+            # take exactly one bounded read per dispatch; GLib re-invokes
+            # the watch while more data is pending
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                hangup = True
+            else:
+                self.server_reply_buffer += chunk
+        except OSError as e:
+            print(f"Error reading server replies: {e}")
+            hangup = True
+
+        # Scan complete lines in place: the regex is anchored at pos/endpos
+        # inside the scratch buffer, so no per-line slice is allocated
+        buf = []
+        start = 0
+        while True:
+            nl = self.server_reply_buffer.find(b"\n", start)
+            if nl < 0:
+                break
+            end = nl
+            if end > start and self.server_reply_buffer[end - 1] == 0x0D:  # \r
+                end -= 1
+            m = _SEG_RE.match(self.server_reply_buffer, start, end)
+            start = nl + 1
+            if not m:
+                continue
+
+            key = (int(m[1]) << 32) | int(m[2])
+            if key in self.seen_segments_set:
+                continue
+            if len(self.seen_segments_ring) == self.seen_segments_ring.maxlen:
+                self.seen_segments_set.discard(self.seen_segments_ring[0])
+            self.seen_segments_ring.append(key)
+            self.seen_segments_set.add(key)
+            buf.append(m[3].decode())
+
+        if start:
+            del self.server_reply_buffer[:start]  # Keep any partial trailing line
+
+        if buf:
+            # One xdotool spawn for the whole batch instead of one per chunk
+            self.type_text(" ".join(buf) + " ")
+
+        if hangup:
+            self.server_reply_watch_id = None
+            # EOF mid-recording means the server went away: surface the
+            # error and resume the periodic probe
+            self.update_status_text(StatusKind.SERVER_ERROR)
+            self.drop_server_connection()
+            if not self.server_check_timer:
+                self.set_up_server_status_check_timer()
+            return False
+        return True
 
     def type_text(self, text: str) -> bool:
         """Type the text and save to transcript."""
+        # Append to current session first in case the text is not typed. We don't want to lose anything.
+        self.append_to_transcript(text.strip())
+
+        if self.xdotool_proc and self.xdotool_proc.poll() is None:
+            try:
+                for line in text.split("\n"):
+                    # xdotool script mode tokenizes with shell-style
+                    # expansion ($1-style script parameters), so $ and
+                    # backticks must be escaped along with \ and " or
+                    # dictated text like "costs $5" gets expanded away
+                    # (behavior per xdotool(1) script-mode parameters)
+                    escaped = (
+                        line.replace("\\", "\\\\")
+                        .replace('"', '\\"')
+                        .replace("$", "\\$")
+                        .replace("`", "\\`")
+                    )
+                    self.xdotool_proc.stdin.write(
+                        f'type --clearmodifiers --delay 0 -- "{escaped}"\n'.encode()
+                    )
+                return True
+            except OSError as e:
+                print(f"Error writing to xdotool: {e}")
+                self.xdotool_proc = None  # Fall back to one-shot spawns
+
         try:
-            # Append to current session first in case the text is not typed. We don't want to lose anything.
-            self.append_to_transcript(text.strip())
+            # --delay 0 lets XTest events go out as fast as the server
+            # accepts them; "--" keeps a leading "-" in the text from being
+            # read as a flag
             subprocess.run(
-                ["xdotool", "type", "--clearmodifiers", "--delay", "1", text],
+                ["xdotool", "type", "--clearmodifiers", "--delay", "0", "--", text],
                 check=True,
             )
             return True
@@ -400,50 +660,96 @@ class WhisperIndicatorApp:
         self.current_session_text.append(text)
 
     def save_session_transcript(self) -> None:
-        """Save the current session's transcript to the JSON file."""
-        try:
-            # Create empty JSON if file doesn't exist
-            if not self.transcript_path.exists():
-                with open(self.transcript_path, "w", encoding="utf-8") as f:
-                    json.dump({}, f, indent=2)
+        """Queue the current session's transcript for the background writer."""
+        if self.session_start_time:
+            self.transcript_writer_q.put(
+                (self.session_start_time, " ".join(self.current_session_text))
+            )
 
-            # Read existing transcripts
-            with open(self.transcript_path, "r", encoding="utf-8") as f:
-                transcripts = json.load(f)
+    def transcript_writer_loop(self) -> None:
+        """Append queued sessions to the JSONL transcript file.
 
-            # Add new session
-            if self.session_start_time:
-                transcripts[self.session_start_time] = " ".join(
-                    self.current_session_text
+        Runs on a daemon thread; each session is one O(1) append instead of
+        rewriting the whole transcript file on the main thread.
+        """
+        self.migrate_legacy_transcript()
+        # One long-lived append handle: each session costs a write+flush
+        # instead of an open/write/close syscall triple
+        writer_fh = None
+        while True:
+            timestamp, text = self.transcript_writer_q.get()
+            try:
+                if writer_fh is None:
+                    writer_fh = open(
+                        self.transcript_jsonl_path, "a", encoding="utf-8"
+                    )
+                # ensure_ascii=False writes the text's own UTF-8 instead of
+                # \uXXXX escapes - fewer bytes and a faster encoder path
+                writer_fh.write(
+                    json.dumps({"ts": timestamp, "text": text}, ensure_ascii=False)
+                    + "\n"
                 )
+                writer_fh.flush()
+            except Exception as e:
+                print(f"Error saving transcript: {e}")
+                writer_fh = None  # Reopen on the next session
+            finally:
+                self.transcript_writer_q.task_done()
 
-            # Write back to file
-            with open(self.transcript_path, "w", encoding="utf-8") as f:
-                json.dump(transcripts, f, indent=2)
+    def migrate_legacy_transcript(self) -> None:
+        """One-time migration of the legacy JSON transcript dict to JSONL.
 
+        Emits one line per session into the sidecar and renames the old
+        file out of the way so it is never re-parsed or re-migrated.
+        """
+        if not self.transcript_path.exists():
+            return
+        try:
+            with open(self.transcript_path, "r", encoding="utf-8") as f:
+                transcripts = json.load(f)
+            with open(self.transcript_jsonl_path, "a", encoding="utf-8") as f:
+                for timestamp in sorted(transcripts.keys()):
+                    f.write(
+                        json.dumps(
+                            {"ts": timestamp, "text": transcripts[timestamp]},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+            self.transcript_path.rename(
+                self.transcript_path.with_name(self.transcript_path.name + ".bak")
+            )
         except Exception as e:
-            print(f"Error saving transcript: {e}")
+            print(f"Error migrating legacy transcript: {e}")
 
     def update_timer_for_transcription(self) -> bool:
         """Update the recording timer display."""
         if not self.is_recording:
             return False
 
-        if self.recording_start_time is not None:
-            self.recording_duration = int(time.time() - self.recording_start_time)
+        if self.recording_start_mono is not None:
+            new_duration = int(time.monotonic() - self.recording_start_mono)
         else:
-            self.recording_duration = 0
-
-        # Show current/max duration format
-        self.indicator.set_label(
-            f"{self.recording_duration}/{self.max_recording_duration}s", ""
-        )
+            new_duration = 0
+
+        # Show current/max duration format, but only touch GTK when the
+        # displayed second actually changed
+        if new_duration != self.recording_duration:
+            self.recording_duration = new_duration
+            self.indicator.set_label(
+                f"{self.recording_duration}/{self.max_recording_duration}s", ""
+            )
 
         if self.recording_duration >= self.max_recording_duration:
             # Stop the timer, toggle recording, and play a beep sound to indicate the end of the recording
             GLib.idle_add(self.toggle_mic_transcription)
-            subprocess.run(
-                ["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"]
+            # Fire-and-forget: a blocking run() would stall the main loop
+            # for the duration of the playback
+            subprocess.Popen(
+                ["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
             return False  # Don't continue the timer
 
@@ -456,50 +762,78 @@ class WhisperIndicatorApp:
             print("Not recording, returning False")
             return False
 
-        if self.recording_start_time is not None:
-            duration = time.time() - self.recording_start_time
-            print(f"Recording duration: {duration}")
-            self.recording_duration = int(duration)
+        if self.recording_start_mono is not None:
+            new_duration = int(time.monotonic() - self.recording_start_mono)
         else:
             print("Recording start time is None, setting duration to 0")
-            self.recording_duration = 0
+            new_duration = 0
 
-        self.indicator.set_label(f"{self.recording_duration}s", "")
+        if new_duration != self.recording_duration:
+            self.recording_duration = new_duration
+            self.indicator.set_label(f"{self.recording_duration}s", "")
 
         return True
 
     def kill_transcription_processes(self) -> None:
         """Clean up recording processes."""
-        for proc_name, proc in [
-            ("audio", self.audio_process_for_mic_transcription),
-            ("network", self.netcat_process),
-        ]:
-            if proc:
-                try:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                except Exception as e:
-                    print(f"Error killing {proc_name} process: {e}")
+        if self.server_reply_watch_id is not None:
+            GLib.source_remove(self.server_reply_watch_id)
+            self.server_reply_watch_id = None
 
-        self.audio_process_for_mic_transcription = None
-        self.netcat_process = None
+        # Closing the socket also unblocks the splice thread
+        if self.server_stream_sock is not None:
+            try:
+                self.server_stream_sock.close()
+            except OSError:
+                pass
+            self.server_stream_sock = None
+
+        if self.arecord_process:
+            self.terminate_process_group(self.arecord_process)
+
+        self.arecord_process = None
+
+        if self.xdotool_proc:
+            proc = self.xdotool_proc
+            self.xdotool_proc = None
+            try:
+                # Closing stdin lets xdotool finish its queue and exit on EOF
+                proc.stdin.close()
+            except OSError:
+                pass
+            self.reap_process(proc)
 
     def cleanup_and_quit(self, *args) -> bool:
         """Clean up and quit the application."""
         self.stop_mic_recording_for_transcription()
         self.stop_mic_and_output_recording()
 
-        if hasattr(self, "server_check_timer"):
+        # Let the background writer drain any queued sessions before exiting
+        self.transcript_writer_q.join()
+
+        self.drop_server_connection()
+        self.monitor_pool.shutdown(wait=False)
+        if self.server_check_timer:
             GLib.source_remove(self.server_check_timer)
+            self.server_check_timer = 0
         Gtk.main_quit()
         return False
 
     def restart_service(self, *args) -> None:
         """Restart the whisper client service."""
-        subprocess.run(["systemctl", "--user", "restart", "whisper-client"])
+        # Fire-and-forget: the return value is unused and systemd will
+        # replace this process anyway, so don't block the main loop on it
+        subprocess.Popen(
+            ["systemctl", "--user", "restart", "whisper-client"],
+            start_new_session=True,
+        )
 
     def quit_service(self, *args) -> None:
         """Stop the whisper client service."""
-        subprocess.run(["systemctl", "--user", "stop", "whisper-client"])
+        subprocess.Popen(
+            ["systemctl", "--user", "stop", "whisper-client"],
+            start_new_session=True,
+        )
         self.cleanup_and_quit()
 
     def show_settings(self, widget) -> None:
@@ -509,7 +843,11 @@ class WhisperIndicatorApp:
             self.settings_dialog.present()
             return
 
-        # Create new dialog
+        # Create new dialog, loading the full parser on demand
+        from ui.settings import SettingsDialog
+
+        if self.config is None:
+            self.config = Config.load()
         self.settings_dialog = SettingsDialog(None, self.config)
         while True:  # Keep showing dialog until valid input or cancel
             response = self.settings_dialog.run()
@@ -517,22 +855,47 @@ class WhisperIndicatorApp:
             if response == Gtk.ResponseType.OK:
                 if self.settings_dialog.validate():
                     self.settings_dialog.save_settings()
-                    # Rebind hotkeys with new combination
-                    Keybinder.unbind(self.mic_hotkey)
-                    self.mic_hotkey = self.config["hotkey"]["mic_only"]
-                    Keybinder.bind(self.mic_hotkey, self.toggle_mic_transcription)
-                    Keybinder.unbind(self.mic_and_output_hotkey)
-                    self.mic_and_output_hotkey = self.config["hotkey"]["mic_and_output"]
-                    Keybinder.bind(
-                        self.mic_and_output_hotkey, self.toggle_recording_mic_and_output
-                    )
+                    # Rebuild the typed snapshot from the updated parser and
+                    # refresh the on-disk snapshot for the next warm start
+                    self.cfg = AppConfig.from_mapping(self.config)
+                    Config.write_snapshot(self.cfg)
+                    # Reconnect to the (possibly new) server on the next
+                    # tick, discarding any backoff accumulated against the
+                    # old endpoint so a corrected host is probed right away
+                    self.drop_server_connection()
+                    self.server_probe_backoff = 5.0
+                    self.next_server_probe_at = 0.0
+                    # Rebind only the hotkeys that actually changed; an
+                    # unbind/bind round-trips the X server and can race a
+                    # keypress, so an unchanged binding is left alone
+                    hotkeys_changed = False
+                    if self.cfg.mic_only != self.mic_hotkey:
+                        hotkeys_changed = True
+                        Keybinder.unbind(self.mic_hotkey)
+                        self.mic_hotkey = self.cfg.mic_only
+                        Keybinder.bind(self.mic_hotkey, self.toggle_mic_transcription)
+                        self.mic_toggle_item.set_label(
+                            f"Toggle Mic Transcribe+Type ({self.mic_hotkey})"
+                        )
+                    if self.cfg.mic_and_output != self.mic_and_output_hotkey:
+                        hotkeys_changed = True
+                        Keybinder.unbind(self.mic_and_output_hotkey)
+                        self.mic_and_output_hotkey = self.cfg.mic_and_output
+                        Keybinder.bind(
+                            self.mic_and_output_hotkey,
+                            self.toggle_recording_mic_and_output,
+                        )
+                        self.mic_output_toggle_item.set_label(
+                            f"Toggle Mic and Output Recording ({self.mic_and_output_hotkey})"
+                        )
                     # Update max recording duration
-                    self.max_recording_duration = int(
-                        self.config["recording"]["max_duration"]
-                    )
-                    # Update status labels with new hotkey
-                    self.setup_status_labels()
-                    self.update_status_text(self.labels["ready"])
+                    self.max_recording_duration = self.cfg.max_duration
+                    # The status label table only embeds the hotkeys, so it
+                    # is rebuilt (and the menu repainted) only when one of
+                    # them changed
+                    if hotkeys_changed:
+                        self.setup_status_labels()
+                        self.update_status_text(StatusKind.READY)
                     break  # Exit loop only if validation succeeds
                 # If validation fails, continue loop to show dialog again
             else:  # CANCEL or dialog closed
@@ -543,6 +906,8 @@ class WhisperIndicatorApp:
 
     def show_transcript_history(self, widget) -> None:
         """Show the transcript history dialog."""
+        from ui.transcript import TranscriptViewerDialog
+
         dialog = TranscriptViewerDialog(None, self.transcript_path)
         dialog.run()
         dialog.destroy()
@@ -552,11 +917,8 @@ class WhisperIndicatorApp:
         try:
             print("Starting mic and output recording...")
             self.recording_duration = 0
-            self.recording_start_time = time.time()
+            self.recording_start_mono = time.monotonic()
             self.indicator.set_label(f"0s", "")
-            self.timer_id_for_gui_updates = GLib.timeout_add(
-                1000, self.update_timer_for_recording_mic_and_output
-            )
             current_recording_timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
             mic_file = self.recording_path / f"{current_recording_timestamp}_mic.wav"
             output_file = (
@@ -565,100 +927,123 @@ class WhisperIndicatorApp:
 
             print(f"Recording to: {mic_file} and {output_file}")
 
-            # Start two separate ffmpeg processes
+            # Start two separate ffmpeg processes. Mono PCM capture is
+            # trivial per sample, so -threads 1 on both sides keeps ffmpeg
+            # from spinning up its default min(cpu_count, 16) workers per
+            # process
             mic_cmd = [
                 "ffmpeg",
+                "-threads",
+                "1",
                 "-f",
                 "pulse",
                 "-i",
                 "default",
                 "-ac",
                 "1",  # Mono for mic
+                "-threads",
+                "1",
                 str(mic_file),
             ]
 
-            output_cmd = [
-                "ffmpeg",
-                "-f",
-                "pulse",
-                "-i",
-                "$(pactl get-default-sink).monitor",
-                "-ac",
-                "1",  # Mono for system audio
-                str(output_file),
-            ]
+            # ffmpeg logs dozens of lines per second; unless debugging,
+            # send them to /dev/null so no monitor threads (and their
+            # per-line prints) need to run during recording. When debugging,
+            # stderr (where ffmpeg actually logs) is merged into the stdout
+            # pipe the monitor reads - a second, unread pipe would fill up
+            # and block ffmpeg mid-recording
+            debug = bool(os.environ.get("WHISPER_DEBUG"))
+            ffmpeg_stdout = subprocess.PIPE if debug else subprocess.DEVNULL
+            ffmpeg_stderr = subprocess.STDOUT if debug else subprocess.DEVNULL
 
             print(f"Starting mic recording: {' '.join(mic_cmd)}")
-            # Start both recording processes with stderr redirected to stdout
             self.mic_recording_proc = subprocess.Popen(
                 mic_cmd,
-                stdout=subprocess.PIPE,
-                # stderr=subprocess.STDOUT,  # Redirect stderr to stdout
-                preexec_fn=os.setsid,
+                stdout=ffmpeg_stdout,
+                stderr=ffmpeg_stderr,
+                start_new_session=True,
             )
 
-            # Get the actual sink monitor name
-            sink_monitor = (
-                subprocess.check_output(
-                    ["pactl", "get-default-sink"], text=True
-                ).strip()
-                + ".monitor"
-            )
+            sink_monitor = self.get_default_sink_monitor()
 
             output_cmd = [
                 "ffmpeg",
+                "-threads",
+                "1",
                 "-f",
                 "pulse",
                 "-i",
                 sink_monitor,
                 "-ac",
                 "1",
+                "-threads",
+                "1",
                 str(output_file),
             ]
 
             print(f"Starting output recording: {' '.join(output_cmd)}")
             self.output_recording_proc = subprocess.Popen(
                 output_cmd,
-                stdout=subprocess.PIPE,
-                # stderr=subprocess.STDOUT,  # Redirect stderr to stdout
-                preexec_fn=os.setsid,
+                stdout=ffmpeg_stdout,
+                stderr=ffmpeg_stderr,
+                start_new_session=True,
             )
 
-            # Start threads to monitor ffmpeg output
-            threading.Thread(
-                target=self.monitor_process_output,
-                args=(self.mic_recording_proc, "mic ffmpeg"),
-                daemon=True,
-            ).start()
-            threading.Thread(
-                target=self.monitor_process_output,
-                args=(self.output_recording_proc, "output ffmpeg"),
-                daemon=True,
-            ).start()
+            if debug:
+                # Only run the monitors when their output is wanted
+                self.monitor_pool.submit(
+                    self.monitor_process_output, self.mic_recording_proc, "mic ffmpeg"
+                )
+                self.monitor_pool.submit(
+                    self.monitor_process_output,
+                    self.output_recording_proc,
+                    "output ffmpeg",
+                )
 
             # Used to track if the recording is still running
             self.audio_process_for_recording_mic_and_output = self.mic_recording_proc
             self.is_recording = True
-            self.timer_id_for_gui_updates = GLib.timeout_add(
-                1000, self.update_timer_for_recording_mic_and_output
+            self.timer_id_for_gui_updates = GLib.timeout_add_seconds(
+                1, self.update_timer_for_recording_mic_and_output
             )
-            self.update_status_text(self.labels["recording_mic_and_output"])
+            self.update_status_text(StatusKind.RECORDING_MIC_AND_OUTPUT)
             print("Recording started successfully")
 
         except Exception as e:
             print(f"Error starting mic+output audio recording: {e}")
+            # The cached sink name may be stale (e.g. default sink changed);
+            # re-query it on the next attempt
+            self.cached_default_sink_monitor = None
             self.is_recording = False
             self.kill_recording_processes()
 
+    def get_default_sink_monitor(self) -> str:
+        """Return the default sink's monitor source, caching the pactl lookup."""
+        if self.cached_default_sink_monitor is None:
+            self.cached_default_sink_monitor = (
+                subprocess.check_output(["pactl", "get-default-sink"], text=True).strip()
+                + ".monitor"
+            )
+        return self.cached_default_sink_monitor
+
     def monitor_process_output(self, process: subprocess.Popen, name: str) -> None:
         """Monitor and log output from a subprocess."""
+        if not process.stdout:
+            return
         try:
+            # Bulk read1 + split instead of readline: ffmpeg logs dozens of
+            # lines per second, and this amortizes the syscalls and Python
+            # frames over a 16 KiB chunk at a time
+            tail = b""
             while True:
-                if process.stdout:
-                    line = process.stdout.readline()
-                    if not line:
-                        break
-                    print(f"{name}: {line.decode().strip()}")
+                chunk = process.stdout.read1(16384)
+                if not chunk:
+                    break
+                *lines, tail = (tail + chunk).split(b"\n")
+                for line in lines:
+                    print(f"{name}: {line.decode(errors='replace').strip()}")
+            if tail:
+                print(f"{name}: {tail.decode(errors='replace').strip()}")
         except Exception as e:
             print(f"Error monitoring {name}: {e}")
 
@@ -676,12 +1061,58 @@ class WhisperIndicatorApp:
     def kill_recording_processes(self) -> None:
         """Helper to clean up recording processes."""
         if hasattr(self, "mic_recording_proc") and self.mic_recording_proc:
-            os.killpg(os.getpgid(self.mic_recording_proc.pid), signal.SIGTERM)
+            self.terminate_process_group(self.mic_recording_proc)
             self.mic_recording_proc = None
         if hasattr(self, "output_recording_proc") and self.output_recording_proc:
-            os.killpg(os.getpgid(self.output_recording_proc.pid), signal.SIGTERM)
+            self.terminate_process_group(self.output_recording_proc)
             self.output_recording_proc = None
 
+    @staticmethod
+    def terminate_process_group(proc: subprocess.Popen) -> None:
+        """Signal a child's process group and reap it off the main thread.
+
+        SIGTERM is sent immediately; the wait (and a SIGKILL escalation if
+        the child ignores SIGTERM) happens on a daemon thread, so stopping a
+        recording never blocks the GTK main loop on process exit, and no
+        zombies are left behind.
+        """
+        try:
+            # start_new_session makes the child its own group leader, so
+            # its pid is the pgid - no getpgid syscall needed
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # Already gone
+
+        def reap() -> None:
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                proc.wait()
+
+        threading.Thread(target=reap, daemon=True).start()
+
+    @staticmethod
+    def reap_process(proc: subprocess.Popen) -> None:
+        """Wait for a child that is exiting on its own, off the main thread.
+
+        For children like xdotool that quit on stdin EOF rather than on a
+        signal; kills the process directly if it lingers so no zombie is
+        left per session.
+        """
+
+        def reap() -> None:
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+        threading.Thread(target=reap, daemon=True).start()
+
     def run(self) -> None:
         """Start the application main loop."""
         Gtk.main()
@@ -1,11 +1,19 @@
-import re
 import socket
-from pathlib import Path
+import string
 import gi
 
+from config import Config
+
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk  # noqa: E402 # type: ignore[import]
 
+# Characters allowed in a DNS label; checked with a linear scan so pasted
+# garbage can't trigger regex backtracking on the GUI thread
+_LABEL_OK = frozenset(string.ascii_letters + string.digits + "-")
+
+# Hosts people actually type, accepted before any parsing work
+_KNOWN_HOSTS_OK = frozenset({"localhost", "127.0.0.1", "::1"})
+
 
 class SettingsDialog(Gtk.Dialog):
     """Dialog for editing application settings."""
@@ -96,23 +104,34 @@ class SettingsDialog(Gtk.Dialog):
             if not host:
                 raise ValueError("Host cannot be empty")
 
-            # Check if it's an IP address
-            try:
-                # Try parsing as IPv4
-                parts = host.split(".")
-                if len(parts) == 4 and all(0 <= int(part) <= 255 for part in parts):
-                    return True
-
-                # Try parsing as IPv6
-                socket.inet_pton(socket.AF_INET6, host)
-                return True
-
-            except (ValueError, socket.error):
-                # Not an IP address, validate as domain name
-                if not self.is_valid_domain(host):
+            # Common hosts are accepted outright; otherwise cheap shape
+            # checks route to a single C-level inet_pton parse (a colon
+            # means IPv6, a digit-led dotted quad means IPv4) and anything
+            # else validates as a domain name
+            if host in _KNOWN_HOSTS_OK:
+                pass
+            elif ":" in host:
+                try:
+                    socket.inet_pton(socket.AF_INET6, host)
+                except OSError:
                     raise ValueError(
                         "Invalid host format. Please enter a valid IP address or domain name"
                     )
+            elif host.count(".") == 3 and host[0].isdigit():
+                try:
+                    socket.inet_pton(socket.AF_INET, host)
+                except OSError:
+                    # Digit-led hostnames like 0.pool.ntp.org share this
+                    # shape; fall back to domain validation rather than
+                    # rejecting them as malformed IPs
+                    if not self.is_valid_domain(host):
+                        raise ValueError(
+                            "Invalid host format. Please enter a valid IP address or domain name"
+                        )
+            elif not self.is_valid_domain(host):
+                raise ValueError(
+                    "Invalid host format. Please enter a valid IP address or domain name"
+                )
 
             # Validate hotkey (basic check)
             hotkey = self.hotkey_entry.get_text().strip()
@@ -135,19 +154,30 @@ class SettingsDialog(Gtk.Dialog):
 
     def is_valid_domain(self, domain):
         """Validate domain name format."""
-        if len(domain) > 255:
+        # 253 is the maximum textual hostname length (RFC 1035 minus the
+        # trailing dot and length octets)
+        if len(domain) > 253:
             return False
 
         # Allow localhost
         if domain == "localhost":
             return True
 
-        # Domain name validation pattern
-        pattern = r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-        if re.match(pattern, domain):
-            return True
+        # Validate label-by-label; worst case is O(len(domain)) with no
+        # backtracking regardless of input
+        labels = domain.split(".")
+        if len(labels) < 2:
+            return False
+        for label in labels:
+            if not (1 <= len(label) <= 63):
+                return False
+            if label[0] == "-" or label[-1] == "-":
+                return False
+            if not all(c in _LABEL_OK for c in label):
+                return False
 
-        return False
+        # The TLD must be alphabetic and at least two characters
+        return len(labels[-1]) >= 2 and labels[-1].isalpha()
 
     def save_settings(self):
         """Save the settings to the config.ini file."""
@@ -157,9 +187,7 @@ class SettingsDialog(Gtk.Dialog):
         self.config["hotkey"]["mic_and_output"] = self.mic_and_output_entry.get_text()
         self.config["recording"]["max_duration"] = self.duration_entry.get_text()
 
-        config_path = Path.home() / ".config" / "whisper-client" / "config.ini"
-        with open(config_path, "w") as f:
-            self.config.write(f)
+        Config.save(self.config)
 
     def restore_defaults(self, button):
         """Restore default settings values for port, hotkey and duration."""
@@ -4,10 +4,47 @@ import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, GLib, Gdk  # noqa: E402 # type: ignore[import]
 
+_CSS_BYTES = b"""
+    treeview {
+        padding: 5px;
+    }
+    treeview:hover {
+        background-color: alpha(@theme_selected_bg_color, 0.1);
+    }
+    .cell {
+        padding: 4px;
+    }
+    .cell:hover {
+        background-color: @theme_selected_bg_color;
+        border-radius: 4px;
+        box-shadow: inset 0 1px rgba(255, 255, 255, 0.1),
+                   inset 0 -1px rgba(0, 0, 0, 0.1);
+    }
+    .copy-button {
+        background-color: @theme_bg_color;
+        border: 1px solid @borders;
+        border-radius: 4px;
+        padding: 4px;
+        box-shadow: inset 0 1px rgba(255, 255, 255, 0.1),
+                   inset 0 -1px rgba(0, 0, 0, 0.1);
+    }
+    .copy-button:hover {
+        background-color: @theme_selected_bg_color;
+    }
+"""
+
+# Parsed transcript rows shared across dialog opens, keyed by the source
+# files' mtimes so an unchanged history is never re-read or re-sorted
+_TRANSCRIPT_CACHE = {"key": None, "entries": []}
+
 
 class TranscriptViewerDialog(Gtk.Dialog):
     """Dialog for viewing and copying transcripts."""
 
+    # CSS is parsed once on first open and the provider shared by every
+    # dialog instance after that
+    _css_provider = None
+
     def __init__(self, parent, transcript_path):
         super().__init__(
             title="Transcript History",
@@ -62,58 +99,60 @@ class TranscriptViewerDialog(Gtk.Dialog):
         copy_col.set_title("")
         self.view.append_column(copy_col)
 
-        # Update CSS styling to include button effects
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            treeview {
-                padding: 5px;
-            }
-            treeview:hover {
-                background-color: alpha(@theme_selected_bg_color, 0.1);
-            }
-            .cell {
-                padding: 4px;
-            }
-            .cell:hover {
-                background-color: @theme_selected_bg_color;
-                border-radius: 4px;
-                box-shadow: inset 0 1px rgba(255, 255, 255, 0.1),
-                           inset 0 -1px rgba(0, 0, 0, 0.1);
-            }
-            .copy-button {
-                background-color: @theme_bg_color;
-                border: 1px solid @borders;
-                border-radius: 4px;
-                padding: 4px;
-                box-shadow: inset 0 1px rgba(255, 255, 255, 0.1),
-                           inset 0 -1px rgba(0, 0, 0, 0.1);
-            }
-            .copy-button:hover {
-                background-color: @theme_selected_bg_color;
-            }
-        """)
-
-        # Apply the CSS styling
+        # Apply the CSS styling, parsing it only on the first open
+        if TranscriptViewerDialog._css_provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_data(_CSS_BYTES)
+            TranscriptViewerDialog._css_provider = provider
         style_context = self.view.get_style_context()
         style_context.add_provider(
-            css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            TranscriptViewerDialog._css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
         )
         style_context.add_class("copy-button")
 
-        # Update the ListStore to not include the icon name since we set it in the renderer
-        self.store = Gtk.ListStore(str, str)  # timestamp, text only
-        self.view.set_model(self.store)
-
         scrolled.add(self.view)
 
-        # Load transcripts
+        # Load transcripts from the legacy JSON file plus the JSONL sidecar
+        # that new sessions are appended to. Sessions are appended in
+        # chronological order, so the file order is the sort order and no
+        # global key sort is needed - just walk the entries backwards.
         try:
-            if transcript_path.exists():
-                with open(transcript_path, "r", encoding="utf-8") as f:
-                    transcripts = json.load(f)
-                    # Sort by timestamp in reverse order (newest first)
-                    for timestamp in sorted(transcripts.keys(), reverse=True):
-                        self.store.append([timestamp, transcripts[timestamp]])
+            jsonl_path = transcript_path.with_suffix(".jsonl")
+            cache_key = (
+                transcript_path.stat().st_mtime_ns
+                if transcript_path.exists()
+                else None,
+                jsonl_path.stat().st_mtime_ns if jsonl_path.exists() else None,
+            )
+            if cache_key == _TRANSCRIPT_CACHE["key"]:
+                # Neither file changed since the last open; two stat()
+                # calls replace the whole parse
+                entries = _TRANSCRIPT_CACHE["entries"]
+            else:
+                entries = []  # (timestamp, text) in chronological order
+                if transcript_path.exists():
+                    with open(transcript_path, "r", encoding="utf-8") as f:
+                        legacy = json.load(f)
+                    for timestamp in sorted(legacy.keys()):
+                        entries.append((timestamp, legacy[timestamp]))
+
+                if jsonl_path.exists():
+                    with open(jsonl_path, "r", encoding="utf-8") as f:
+                        # Stream line-by-line; each line is one session
+                        for line in f:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            entry = json.loads(line)
+                            entries.append((entry["ts"], entry["text"]))
+
+                _TRANSCRIPT_CACHE["key"] = cache_key
+                _TRANSCRIPT_CACHE["entries"] = entries
+
+            # Newest first
+            for timestamp, text in reversed(entries):
+                self.store.append([timestamp, text])
         except Exception as e:
             print(f"Error loading transcripts: {e}")
 
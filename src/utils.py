@@ -1,14 +1,21 @@
 import os
-import subprocess
+from pathlib import Path
 
 
 def setup_display() -> None:
     """Set up the DISPLAY environment variable for X11 GUI operations.
     This is particularly important when running as a service."""
+    if os.environ.get("DISPLAY"):
+        return
+    if os.environ.get("WAYLAND_DISPLAY"):
+        # Pure Wayland session: there is no X display to discover
+        return
+    # Infer the display from the X server's socket directory instead of
+    # forking `w`; fall back to :0 if no socket is found
     try:
-        # Try to get the current display from the 'w' command output
-        display = subprocess.check_output(["w", "-hs"]).decode().split()[2]
-        os.environ["DISPLAY"] = display
-    except (subprocess.SubprocessError, IndexError):
-        # Fall back to :0 if we can't determine the display
-        os.environ["DISPLAY"] = ":0"
+        display_num = next(
+            (p.name[1:] for p in Path("/tmp/.X11-unix").glob("X*")), "0"
+        )
+    except OSError:
+        display_num = "0"
+    os.environ["DISPLAY"] = f":{display_num}"